@@ -2,6 +2,7 @@ import customtkinter as ctk
 import pandas as pd
 from pages.main_page import MainPage
 from pages.setup_page import SetupPage
+from pages.settings_store import SettingsStore
 import tkinter as tk
 
 
@@ -18,16 +19,15 @@ class AppController(ctk.CTk):
         self.protocol("WM_DELETE_WINDOW", self.on_close)  # Handle window close safely
 
         # ---------------- Shared Data ----------------
-        self.shared_data = {
+        # Typed settings store: entry edits are coalesced and only fire change
+        # events for the keys that actually changed once typing pauses.
+        self.shared_data = SettingsStore(self, {
             "dataframe": pd.DataFrame(),
             "excel_file": "PLC_Log.xlsx",
             "tags_to_monitor": [],
             "interval": 5,
             "ip": "192.168.1.10"
-        }
-
-        # Registered listener callbacks (e.g., MainPage, SetupPage)
-        self.data_listeners = []
+        })
 
         # ---------------- Page Container ----------------
         container = ctk.CTkFrame(self)
@@ -54,23 +54,19 @@ class AppController(ctk.CTk):
             frame.on_show()
 
     # ---------------- Shared Data Sync ----------------
-    def register_listener(self, listener_callback):
-        """Register a page method to be notified when shared_data changes."""
-        if listener_callback not in self.data_listeners:
-            self.data_listeners.append(listener_callback)
+    def register_listener(self, listener_callback, keys=None):
+        """Register a page method to be called with the changed settings (optionally only for `keys`)."""
+        self.shared_data.subscribe(listener_callback, keys)
 
     def notify_data_change(self):
-        """Notify all registered pages that shared_data was updated."""
-        for callback in self.data_listeners:
-            try:
-                callback(self.shared_data)
-            except Exception as e:
-                print(f"⚠️ Listener error: {e}")
+        """Push pending shared_data changes to listeners now instead of waiting for the debounce."""
+        self.shared_data.flush()
 
     # ---------------- Graceful App Shutdown ----------------
     def on_close(self):
         """Stop logging, save data, and close safely."""
         print("🛑 Application shutting down...")
+        self.shared_data.cancel()
 
         # --- Call on_close for all pages ---
         for page_name, frame in self.frames.items():
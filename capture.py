@@ -0,0 +1,178 @@
+import datetime
+import queue
+import threading
+import time
+from collections import deque
+
+import pandas as pd
+from pycomm3 import LogixDriver
+from pages.trigger import TriggerCondition
+
+
+# ---------------- High-Speed Capture ----------------
+class TriggerCapture:
+    """Fast polling loop that keeps a rolling pre-trigger buffer and saves a window around each trigger.
+
+    PLC reads run on a background thread so a slow or unreachable PLC never
+    blocks the GUI; samples are handed to the Tk thread through a queue, where
+    trigger handling happens, and each finished window is written to disk on
+    its own short-lived thread. The condition fires on its rising
+    edge (False -> True); the samples from pre_seconds before to post_seconds
+    after the trigger are written to their own capture_<timestamp>.xlsx file.
+    """
+
+    DRAIN_MS = 100  # how often the Tk thread picks up new samples
+
+    def __init__(self, widget, ip, tags, condition, interval, pre_seconds, post_seconds, retry_seconds=5.0):
+        self.widget = widget
+        self.ip = ip
+        self.condition = condition
+        self.interval = interval
+        self.pre_window = datetime.timedelta(seconds=pre_seconds)
+        self.post_window = datetime.timedelta(seconds=post_seconds)
+        self.retry_seconds = max(retry_seconds, interval)
+        self.read_tags = list(tags)
+        if condition.tag not in self.read_tags:
+            self.read_tags.append(condition.tag)
+
+        self.samples = queue.Queue()  # (datetime, row) from the reader thread
+        self.buffer = deque()  # (datetime, row) covering the last pre_seconds
+        self.stop_event = threading.Event()
+        self.reader = None
+        self.after_id = None
+        self.last_state = None
+        self.capture_rows = None  # list while recording the post-trigger window
+        self.capture_end = None
+
+    # ---------------- Loop Control ----------------
+    def start(self):
+        self.stop()
+        self.stop_event = threading.Event()
+        self.reader = threading.Thread(target=self._read_loop, args=(self.stop_event,), daemon=True)
+        self.reader.start()
+        self._drain()
+        print(f"🎯 Capture armed on '{self.condition}' every {int(self.interval * 1000)} ms")
+
+    def stop(self):
+        self.stop_event.set()
+        if self.after_id is not None:
+            try:
+                self.widget.after_cancel(self.after_id)
+            except Exception:
+                pass
+            self.after_id = None
+        if self.capture_rows:
+            self._save(self.capture_rows)  # don't lose a partial window
+        self.capture_rows = None
+        # The daemon reader exits on its own once its current read/connect returns.
+        self.reader = None
+
+    # ---------------- Reader Thread ----------------
+    def _read_loop(self, stop_event):
+        """Sample the PLC at the capture rate; back off to retry_seconds while it is unreachable."""
+        plc = None
+        next_read = time.monotonic()
+        while not stop_event.is_set():
+            try:
+                if plc is None:
+                    # Keep one connection open: re-opening a session per sample is slower than the read.
+                    plc = LogixDriver(self.ip)
+                    plc.open()
+                    print(f"🔌 Capture connected to {self.ip}")
+                self.samples.put(self._read_row(plc))
+            except Exception as e:
+                print(f"⚠️ Capture read failed, retrying in {self.retry_seconds:g}s: {e}")
+                plc = self._close(plc)
+                stop_event.wait(self.retry_seconds)
+                next_read = time.monotonic()
+                continue
+
+            next_read += self.interval
+            delay = next_read - time.monotonic()
+            if delay < 0:  # fell behind; don't burst to catch up
+                next_read = time.monotonic()
+                delay = 0
+            stop_event.wait(delay)
+        self._close(plc)
+
+    @staticmethod
+    def _close(plc):
+        if plc is not None:
+            try:
+                plc.close()
+            except Exception:
+                pass
+        return None
+
+    def _read_row(self, plc):
+        now = datetime.datetime.now()
+        row = {"Timestamp": now.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]}
+        results = plc.read(*self.read_tags)
+        if not isinstance(results, list):
+            results = [results]
+        for tag, result in zip(self.read_tags, results):
+            if result.error:
+                row[tag] = None
+                row["Error"] = f"{tag}: {result.error}"
+                continue
+            value = result.value
+            if isinstance(value, (list, tuple)):
+                for i, v in enumerate(value):
+                    row[f"{tag}[{i}]"] = v
+            else:
+                row[tag] = value
+        return now, row
+
+    # ---------------- Trigger Handling (Tk thread) ----------------
+    def _drain(self):
+        if not self.widget.winfo_exists():
+            self.stop_event.set()
+            return
+        try:
+            while True:
+                self._handle_sample(*self.samples.get_nowait())
+        except queue.Empty:
+            pass
+        except Exception as e:
+            print(f"⚠️ Capture error: {e}")
+        self.after_id = self.widget.after(self.DRAIN_MS, self._drain)
+
+    def _handle_sample(self, when, row):
+        # Windows are measured on sample timestamps, not a nominal sample count,
+        # so jitter in the read rate doesn't shrink or stretch them.
+        self.buffer.append((when, row))
+        while self.buffer and self.buffer[0][0] < when - self.pre_window:
+            self.buffer.popleft()
+
+        if self.capture_rows is not None:
+            self.capture_rows.append(dict(row, Capture="post"))
+            if when >= self.capture_end:
+                self._save(self.capture_rows)
+                self.capture_rows = None
+
+        state = self.condition.evaluate(row)
+        if state and self.last_state is False and self.capture_rows is None:
+            print(f"⚡ Trigger fired: {self.condition}")
+            pre = [dict(r, Capture="pre") for _, r in list(self.buffer)[:-1]]
+            self.capture_rows = pre + [dict(row, Capture="trigger")]
+            self.capture_end = when + self.post_window
+        if state is not None:
+            self.last_state = state
+
+    def _save(self, rows):
+        """Write a finished window without blocking the Tk thread.
+
+        Not a daemon thread, so a capture finishing as the app closes is still written.
+        """
+        threading.Thread(target=self._write, args=(rows,), name="capture-writer").start()
+
+    @staticmethod
+    def _write(rows):
+        trigger_time = next((r["Timestamp"] for r in rows if r.get("Capture") == "trigger"), rows[0]["Timestamp"])
+        stamp = trigger_time.replace(":", "-").replace(" ", "_")
+        filename = f"capture_{stamp}.xlsx"
+        try:
+            pd.DataFrame(rows).to_excel(filename, index=False)
+            print(f"💾 Capture saved to {filename} ({len(rows)} samples)")
+        except Exception as e:
+            print(f"⚠️ Failed to save capture: {e}")
@@ -0,0 +1,288 @@
+"""Bulk export of the daily log_{date}.xlsx files into one CSV, Parquet or XLSX file.
+
+Example:
+    python export_logs.py --start 2025-11-01 --end 2025-11-30 --tags Motor_Speed Fault_Bit \
+        --resample 1min --agg mean --format xlsx --output november.xlsx
+"""
+import argparse
+import datetime
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+TEXT_COLUMNS = ("Error", "Info")
+AGGREGATIONS = ("mean", "min", "max", "first", "last", "median")
+
+# Per-file partial results that can be combined when a resample bin spans
+# several daily files: partial stat -> how partials from different files merge.
+# mean is rebuilt from sum/count; median has no partial form (see main()).
+PARTIALS = {"mean": ("sum", "count"), "min": ("min",), "max": ("max",), "first": ("first",), "last": ("last",)}
+COMBINE = {"sum": "sum", "count": "sum", "min": "min", "max": "max", "first": "first", "last": "last"}
+
+
+# ---------------- Log Discovery ----------------
+def find_log_files(log_dir, start, end):
+    """Return the existing log_{date}.xlsx paths from start to end (inclusive), in date order."""
+    paths = []
+    day = start
+    while day <= end:
+        path = os.path.join(log_dir, f"log_{day.strftime('%Y-%m-%d')}.xlsx")
+        if os.path.exists(path):
+            paths.append(path)
+        day += datetime.timedelta(days=1)
+    return paths
+
+
+def read_header(path):
+    return list(pd.read_excel(path, nrows=0).columns)
+
+
+def build_columns(headers, tags):
+    """Union of all file headers in first-seen order, optionally limited to `tags`."""
+    columns = ["Timestamp"]
+    for header in headers:
+        for col in header:
+            if col not in columns:
+                columns.append(col)
+    if tags:
+        wanted = set(tags)
+        columns = ["Timestamp"] + [
+            c for c in columns[1:] if {c, c.split("[")[0], c.split("{")[0]} & wanted
+        ]
+    return columns
+
+
+# ---------------- Worker ----------------
+def load_log(path, columns, resample=None, agg="mean"):
+    """Read one daily log, keep `columns`, coerce tag values to numbers and optionally resample.
+
+    With an aggregation listed in PARTIALS the resampled frame holds partial
+    (column, stat) results indexed by bin; merge_bins() finishes them.
+    Runs in a worker process, so it only takes and returns picklable values.
+    """
+    df = pd.read_excel(path, usecols=lambda c: c in columns)
+    df = df.reindex(columns=columns)
+    df["Timestamp"] = pd.to_datetime(df["Timestamp"], errors="coerce")
+    df = df.dropna(subset=["Timestamp"])
+
+    for col in columns[1:]:
+        if col in TEXT_COLUMNS:
+            df[col] = df[col].astype("string")
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+
+    if resample:
+        value_cols = [c for c in columns[1:] if c not in TEXT_COLUMNS]
+        # Fixed-length bins use the epoch origin so bin edges are identical in every
+        # file; calendar offsets (1W, 1MS) are anchored by pandas already.
+        options = {"origin": "epoch"} if isinstance(resample, pd.Timedelta) else {}
+        resampler = df.set_index("Timestamp")[value_cols].resample(resample, **options)
+        if agg in PARTIALS:
+            return resampler.agg(list(PARTIALS[agg]))
+        df = resampler.agg(agg).dropna(how="all").reset_index()
+    return df
+
+
+def finish_bins(partial, columns, agg):
+    """Turn (column, stat) partials into one final value per column."""
+    if agg == "mean":
+        df = pd.DataFrame({
+            col: partial[(col, "sum")] / partial[(col, "count")].where(partial[(col, "count")] > 0)
+            for col in columns[1:]
+        })
+    else:
+        df = pd.DataFrame({col: partial[(col, agg)] for col in columns[1:]})
+    df.index.name = "Timestamp"
+    return df.dropna(how="all").reset_index()
+
+
+def merge_bins(partials, columns, agg):
+    """Combine per-file partials in date order, merging bins that span files (e.g. 1W, 1MS).
+
+    Files arrive in date order, so only the last bin of one file can continue
+    into the next; that single bin is carried forward and everything before it
+    is final.
+    """
+    carry = None
+    for partial in partials:
+        if partial.empty:
+            continue
+        if carry is not None:
+            merged = pd.concat([carry, partial])
+            partial = merged.groupby(level=0).agg({key: COMBINE[key[1]] for key in merged.columns})
+        yield finish_bins(partial.iloc[:-1], columns, agg)
+        carry = partial.iloc[-1:]
+    if carry is not None:
+        yield finish_bins(carry, columns, agg)
+
+
+def iter_logs(pool, paths, columns, resample, agg, workers):
+    """Yield one frame per log file in date order, reading files in parallel.
+
+    Only `workers * 2` files are in flight at once so memory stays bounded
+    no matter how long the date range is.
+    """
+    pending = deque()
+    remaining = iter(paths)
+    for path in remaining:
+        pending.append((path, pool.submit(load_log, path, columns, resample, agg)))
+        if len(pending) >= workers * 2:
+            break
+    while pending:
+        path, future = pending.popleft()
+        next_path = next(remaining, None)
+        if next_path is not None:
+            pending.append((next_path, pool.submit(load_log, next_path, columns, resample, agg)))
+        try:
+            yield future.result()
+        except Exception as e:
+            print(f"⚠️ Skipping {path}: {e}")
+
+
+# ---------------- Writers ----------------
+def write_csv(frames, output, columns):
+    with open(output, "w", newline="", encoding="utf-8") as f:
+        pd.DataFrame(columns=columns).to_csv(f, index=False)
+        for df in frames:
+            df.to_csv(f, header=False, index=False)
+
+
+def write_parquet(frames, output, columns):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        sys.exit("⚠️ Parquet export needs pyarrow: pip install pyarrow")
+
+    writer = None
+    try:
+        for df in frames:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def write_xlsx(frames, output, columns):
+    try:
+        import xlsxwriter
+    except ImportError:
+        sys.exit("⚠️ XLSX export needs xlsxwriter: pip install xlsxwriter")
+
+    # constant_memory flushes each row to disk once written, so a month of data
+    # never has to be held in the workbook at once.
+    workbook = xlsxwriter.Workbook(output, {"constant_memory": True})
+    time_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+    max_rows = 1048576  # Excel sheet row limit
+    sheet, row = None, max_rows
+    try:
+        for df in frames:
+            for record in df.itertuples(index=False, name=None):
+                if row >= max_rows:
+                    sheet = workbook.add_worksheet()
+                    sheet.write_row(0, 0, columns)
+                    sheet.set_column(0, 0, 20)
+                    row = 1
+                sheet.write_datetime(row, 0, record[0].to_pydatetime(), time_format)
+                for col, value in enumerate(record[1:], start=1):
+                    if not pd.isna(value):
+                        sheet.write(row, col, value)
+                row += 1
+        if sheet is None:
+            workbook.add_worksheet().write_row(0, 0, columns)
+    finally:
+        workbook.close()
+
+
+WRITERS = {"csv": write_csv, "parquet": write_parquet, "xlsx": write_xlsx}
+
+
+# ---------------- Command Line ----------------
+def parse_date(text):
+    return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def parse_resample(text):
+    """Return a Timedelta for fixed-length offsets (10s, 1h, 2D) or the offset string for calendar ones."""
+    offset = pd.tseries.frequencies.to_offset(text)
+    if isinstance(offset, pd.offsets.Day):  # not a Tick in newer pandas; logs are naive local time
+        return pd.Timedelta(days=offset.n)
+    if isinstance(offset, pd.offsets.Tick):
+        return pd.Timedelta(offset)
+    return text
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge daily PLC logs over a date range into one export file.")
+    parser.add_argument("--start", type=parse_date, required=True, help="first day, YYYY-MM-DD")
+    parser.add_argument("--end", type=parse_date, help="last day, YYYY-MM-DD (default: same as --start)")
+    parser.add_argument("--log-dir", default=".", help="folder holding log_{date}.xlsx files")
+    parser.add_argument("--tags", nargs="+", help="only export these tags (array tags match all elements)")
+    parser.add_argument("--resample", help="pandas offset to resample to, e.g. 10s, 1min, 1h, 1D, 1W, 1MS")
+    parser.add_argument("--agg", choices=AGGREGATIONS, default="mean", help="aggregation used with --resample")
+    parser.add_argument("--format", choices=sorted(WRITERS), help="output format (default: from --output extension)")
+    parser.add_argument("--output", required=True, help="file to write")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="parallel reader processes")
+    args = parser.parse_args(argv)
+
+    end = args.end or args.start
+    fmt = args.format or os.path.splitext(args.output)[1].lstrip(".").lower()
+    if fmt not in WRITERS:
+        parser.error(f"unknown output format {fmt!r}; use --format {{{','.join(sorted(WRITERS))}}}")
+
+    resample = None
+    if args.resample:
+        try:
+            resample = parse_resample(args.resample)
+        except ValueError:
+            parser.error(f"invalid --resample offset {args.resample!r}")
+        # Medians can't be merged across files, so their bins must not cross midnight.
+        if args.agg not in PARTIALS:
+            one_day = pd.Timedelta(days=1)
+            if not isinstance(resample, pd.Timedelta) or resample > one_day or one_day % resample:
+                parser.error(f"--agg {args.agg} needs a --resample that evenly divides one day (e.g. 1min, 1h, 1D)")
+
+    paths = find_log_files(args.log_dir, args.start, end)
+    if not paths:
+        print(f"ℹ️ No log files found in {args.log_dir} between {args.start} and {end}.")
+        return 1
+
+    workers = max(1, min(args.workers, len(paths)))
+    print(f"📂 Exporting {len(paths)} log file(s) with {workers} worker(s)...")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        headers = []
+        readable = []
+        for path, future in [(path, pool.submit(read_header, path)) for path in paths]:
+            try:
+                headers.append(future.result())
+                readable.append(path)
+            except Exception as e:
+                print(f"⚠️ Skipping {path}: {e}")
+        paths = readable
+        if not paths:
+            print("⚠️ None of the log files could be read.")
+            return 1
+
+        columns = build_columns(headers, args.tags)
+        if args.resample:
+            columns = [c for c in columns if c not in TEXT_COLUMNS]
+        if len(columns) == 1:
+            print("⚠️ None of the requested tags were found in the logs.")
+            return 1
+
+        frames = iter_logs(pool, paths, columns, resample, args.agg, workers)
+        if resample is not None and args.agg in PARTIALS:
+            frames = merge_bins(frames, columns, args.agg)
+        WRITERS[fmt](frames, args.output, columns)
+    print(f"💾 Export saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,13 +5,21 @@ import datetime
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from pages.capture import TriggerCapture
+from pages.trigger import TriggerCondition
 
 
 class MainPage(ctk.CTkFrame):
+    # Settings the refresh loop depends on; changes to anything else never restart it.
+    POLLER_SETTINGS = ("ip", "interval", "tags_to_monitor")
+    # Settings only the high-speed capture uses; changes restart the capture, not the slow log.
+    CAPTURE_SETTINGS = ("capture_condition", "capture_interval", "capture_pre", "capture_post")
+
     def __init__(self, parent, controller):
         super().__init__(parent)
         self.controller = controller
-        self.controller.register_listener(self.on_shared_data_update)
+        self.controller.register_listener(self.on_shared_data_update, keys=self.POLLER_SETTINGS)
+        self.controller.register_listener(self.on_capture_settings_update, keys=self.CAPTURE_SETTINGS)
         self._after_ids = []  # Track all after() jobs
 
         # Shared state
@@ -19,6 +27,9 @@ class MainPage(ctk.CTkFrame):
         self.current_date = datetime.date.today()
         self.tree = None
         self.refresh_job = None
+        self.active_settings = {}  # ip/interval/tags the running loop was started with
+        self.capture = None  # high-speed TriggerCapture running alongside the slow log
+        self.capture_settings = {}  # capture settings the running capture was started with
         self.checkbox_vars = {}
         self.selected_columns = set()
 
@@ -79,17 +90,38 @@ class MainPage(ctk.CTkFrame):
         self.create_table()
 
     # ---------------- Shared Data Sync ----------------
-    def on_shared_data_update(self, new_data):
-        print("🔄 Shared data updated:", new_data)
-        self.current_ip = new_data.get("ip")
-        self.current_interval = new_data.get("interval")
-        self.current_tags = new_data.get("tags_to_monitor")
-        self.controller.data_view = new_data.get("dataframe", self.controller.shared_data["dataframe"])
-
-        if self.refresh_job:
-            self.stop_refresh()
-            self.start_refresh()
-            print("✅ Logging restarted with new settings.")
+    def on_shared_data_update(self, changed):
+        """Called with the (debounced, valid) poller settings that changed."""
+        print("🔄 Shared data updated:", changed)
+        if not self.refresh_job:
+            return
+
+        shared = self.controller.shared_data
+        if not shared.is_valid(*self.POLLER_SETTINGS):
+            return
+        if all(self.active_settings.get(key) == shared[key] for key in self.POLLER_SETTINGS):
+            return
+
+        self.stop_refresh()
+        self.start_refresh()
+        print("✅ Logging restarted with new settings.")
+
+    def on_capture_settings_update(self, changed):
+        """Called with the (debounced, valid) capture settings that changed; leaves the slow log running."""
+        if not self.refresh_job:
+            return
+
+        shared = self.controller.shared_data
+        if not shared.is_valid(*self.CAPTURE_SETTINGS):
+            return
+        if all(self.capture_settings.get(key) == shared[key] for key in self.CAPTURE_SETTINGS):
+            return
+
+        self.start_capture()
+        if self.capture is not None:
+            print("✅ Capture restarted with new settings.")
+        else:
+            print("🎯 Capture disarmed (no trigger set).")
 
     # ---------------- Table ----------------
     def create_table(self):
@@ -160,17 +192,50 @@ class MainPage(ctk.CTkFrame):
         ip = self.controller.shared_data.get("ip")
 
         if not tags or not interval_sec or not ip:
+            self.stop_refresh()  # don't leave an old capture polling the previous settings
             print("⚠️ Logging not started: missing IP, tags, or interval.")
             return
 
         try:
             interval_sec = float(interval_sec)
         except (ValueError, TypeError):
+            self.stop_refresh()
             print("⚠️ Invalid interval. Logging not started.")
             return
 
+        self.active_settings = {"ip": ip, "interval": interval_sec, "tags_to_monitor": list(tags)}
         self._run_refresh_loop(int(interval_sec * 1000))
         print(f"▶ Unified logging started every {interval_sec}s from {ip}")
+        self.start_capture()
+
+    # ---------------- Trigger Capture ----------------
+    def start_capture(self):
+        """Arm the high-speed capture loop if a trigger condition is configured."""
+        self.stop_capture()
+        shared = self.controller.shared_data
+        self.capture_settings = {key: shared.get(key) for key in self.CAPTURE_SETTINGS}
+        condition = self.capture_settings["capture_condition"]
+        if not condition:
+            return
+        if not shared.is_valid(*self.CAPTURE_SETTINGS):
+            print("⚠️ Invalid capture settings. Capture not started.")
+            return
+        self.capture = TriggerCapture(
+            self,
+            ip=self.active_settings["ip"],
+            tags=self.active_settings["tags_to_monitor"],
+            condition=TriggerCondition.parse(condition),
+            interval=self.capture_settings["capture_interval"],
+            pre_seconds=self.capture_settings["capture_pre"],
+            post_seconds=self.capture_settings["capture_post"],
+            retry_seconds=self.active_settings["interval"],  # back off to the slow rate while unreachable
+        )
+        self.capture.start()
+
+    def stop_capture(self):
+        if self.capture is not None:
+            self.capture.stop()
+            self.capture = None
 
     def _run_refresh_loop(self, interval_ms):
         if not self.winfo_exists():
@@ -194,12 +259,14 @@ class MainPage(ctk.CTkFrame):
                 pass
         self._after_ids.clear()
         self.refresh_job = None
+        self.stop_capture()
         print("⏹ Unified logging stopped.")
 
     # ---------------- Data Logging ----------------
     def update_table(self):
-        tags = self.controller.shared_data.get("tags_to_monitor", [])
-        ip = self.controller.shared_data.get("ip")
+        # Poll with the settings the loop was started with, not half-typed entry values
+        tags = self.active_settings.get("tags_to_monitor", [])
+        ip = self.active_settings.get("ip")
         now = datetime.datetime.now()
         data = {"Timestamp": now.strftime("%Y-%m-%d %H:%M:%S")}
 
@@ -335,6 +402,12 @@ class MainPage(ctk.CTkFrame):
                 pass
             self.refresh_job = None
 
+        # --- Stop high-speed capture (saves any partial window) ---
+        try:
+            self.stop_capture()
+        except Exception:
+            pass
+
         # --- Safely close any matplotlib canvases ---
         try:
             if hasattr(self, "canvas"):
@@ -0,0 +1,175 @@
+import re
+from collections.abc import MutableMapping
+from pages.trigger import TriggerCondition
+
+
+# ---------------- Setting Coercers ----------------
+_HOST_LABEL_RE = re.compile(r"^[A-Za-z0-9](?:[A-Za-z0-9-]*[A-Za-z0-9])?$")
+
+
+def _to_ip(value):
+    # Full IPv4 or hostname, optionally with a pycomm3 "/slot" path. Partial
+    # input such as "192.168" is rejected so a pause while typing never reconnects.
+    value = str(value or "").strip()
+    host, _, path = value.partition("/")
+    if "/" in value and (not path or any(ch.isspace() for ch in path)):
+        raise ValueError(f"Invalid PLC path: {value!r}")
+    labels = host.split(".")
+    if host.replace(".", "").isdigit():
+        valid = len(labels) == 4 and all(p.isdigit() and int(p) <= 255 for p in labels)
+    else:
+        valid = bool(host) and all(_HOST_LABEL_RE.match(label) for label in labels)
+    if not valid:
+        raise ValueError(f"Invalid PLC address: {value!r}")
+    return value
+
+
+def _to_interval(value):
+    interval = float(value)
+    if interval <= 0:
+        raise ValueError(f"Interval must be positive: {value!r}")
+    return interval
+
+
+def _to_excel_file(value):
+    value = str(value or "").strip()
+    return value if value else "PLC_Log.xlsx"
+
+
+def _to_tag_list(value):
+    return list(value or [])
+
+
+def _to_condition(value):
+    value = str(value or "").strip()
+    if value:
+        TriggerCondition.parse(value)  # raises ValueError on bad syntax
+    return value
+
+
+def _to_seconds(value):
+    seconds = float(value)
+    if seconds < 0:
+        raise ValueError(f"Duration cannot be negative: {value!r}")
+    return seconds
+
+
+# Typed settings: key -> (default, coercer). Coercers raise ValueError on bad input.
+SETTINGS_SCHEMA = {
+    "ip": ("192.168.1.10", _to_ip),
+    "interval": (5.0, _to_interval),
+    "excel_file": ("PLC_Log.xlsx", _to_excel_file),
+    "tags_to_monitor": ([], _to_tag_list),
+    # High-speed trigger capture (empty condition = disabled)
+    "capture_condition": ("", _to_condition),
+    "capture_interval": (0.05, _to_interval),
+    "capture_pre": (5.0, _to_seconds),
+    "capture_post": (5.0, _to_seconds),
+}
+
+
+class SettingsStore(MutableMapping):
+    """Dict-like shared state with typed settings and debounced per-key change events.
+
+    Keys listed in SETTINGS_SCHEMA are tracked: every assignment is coerced and
+    queued, and subscribers are called once per quiet period with only the keys
+    whose value actually changed and is valid. Any other key (e.g. "dataframe")
+    is stored as-is and never fires events.
+    """
+
+    def __init__(self, tk_root, initial=None, debounce_ms=500):
+        self._root = tk_root
+        self._debounce_ms = debounce_ms
+        self._data = {key: default for key, (default, _) in SETTINGS_SCHEMA.items()}
+        self._valid = {key: True for key in SETTINGS_SCHEMA}
+        self._pending = set()
+        self._flush_job = None
+        self._subscribers = []
+        for key, value in (initial or {}).items():
+            self._store(key, value)
+        self._committed = {key: self._data[key] for key in SETTINGS_SCHEMA}
+
+    # ---------------- Mapping Interface ----------------
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if self._store(key, value):
+            self._pending.add(key)
+            self._schedule_flush()
+
+    def __delitem__(self, key):
+        if key in SETTINGS_SCHEMA:
+            raise KeyError(f"Cannot delete setting {key!r}")
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def _store(self, key, value):
+        """Store a value, coercing typed settings. Returns True if the key is tracked."""
+        if key not in SETTINGS_SCHEMA:
+            self._data[key] = value
+            return False
+        _, coerce = SETTINGS_SCHEMA[key]
+        try:
+            self._data[key] = coerce(value)
+            self._valid[key] = True
+        except (ValueError, TypeError):
+            self._data[key] = None
+            self._valid[key] = False
+        return True
+
+    # ---------------- Validation ----------------
+    def is_valid(self, *keys):
+        """Return True if every given setting currently holds a valid value."""
+        return all(self._valid.get(key, True) for key in keys)
+
+    # ---------------- Subscriptions ----------------
+    def subscribe(self, callback, keys=None):
+        """Call callback(changed) after each flush; keys=None subscribes to all settings."""
+        keys = frozenset(keys) if keys is not None else None
+        if (callback, keys) not in self._subscribers:
+            self._subscribers.append((callback, keys))
+
+    def _schedule_flush(self):
+        if self._flush_job is not None:
+            try:
+                self._root.after_cancel(self._flush_job)
+            except Exception:
+                pass
+        self._flush_job = self._root.after(self._debounce_ms, self.flush)
+
+    def cancel(self):
+        """Drop any scheduled flush (used on shutdown)."""
+        if self._flush_job is not None:
+            try:
+                self._root.after_cancel(self._flush_job)
+            except Exception:
+                pass
+            self._flush_job = None
+
+    def flush(self):
+        """Commit pending settings and notify subscribers of the keys that changed."""
+        self.cancel()
+        pending, self._pending = self._pending, set()
+
+        changed = {}
+        for key in pending:
+            if self._valid[key] and self._data[key] != self._committed[key]:
+                self._committed[key] = self._data[key]
+                changed[key] = self._data[key]
+        if not changed:
+            return
+
+        for callback, keys in list(self._subscribers):
+            relevant = changed if keys is None else {k: v for k, v in changed.items() if k in keys}
+            if not relevant:
+                continue
+            try:
+                callback(relevant)
+            except Exception as e:
+                print(f"⚠️ Listener error: {e}")
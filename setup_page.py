@@ -41,16 +41,37 @@ class SetupPage(ctk.CTkFrame):
         # ---- Test Connection ----
         ctk.CTkButton(self.top_frame, text="Test PLC Connection", fg_color="green", command=self.test_connection).grid(row=1, column=3, padx=5, pady=5)
 
+        # ---- High-Speed Trigger Capture ----
+        ctk.CTkLabel(self.top_frame, text="Capture Trigger:").grid(row=2, column=0, padx=5, pady=5, sticky="w")
+        self.trigger_entry = ctk.CTkEntry(self.top_frame, placeholder_text="e.g. Fault_Bit == 1 (blank = off)")
+        self.trigger_entry.grid(row=2, column=1, padx=5, pady=5, sticky="ew")
+        ctk.CTkLabel(self.top_frame, text="Capture Rate (s):").grid(row=2, column=2, padx=5, pady=5, sticky="w")
+        self.capture_rate_entry = ctk.CTkEntry(self.top_frame, placeholder_text="0.05")
+        self.capture_rate_entry.grid(row=2, column=3, padx=5, pady=5, sticky="ew")
+
+        ctk.CTkLabel(self.top_frame, text="Pre-Trigger (s):").grid(row=3, column=0, padx=5, pady=5, sticky="w")
+        self.capture_pre_entry = ctk.CTkEntry(self.top_frame, placeholder_text="5")
+        self.capture_pre_entry.grid(row=3, column=1, padx=5, pady=5, sticky="ew")
+        ctk.CTkLabel(self.top_frame, text="Post-Trigger (s):").grid(row=3, column=2, padx=5, pady=5, sticky="w")
+        self.capture_post_entry = ctk.CTkEntry(self.top_frame, placeholder_text="5")
+        self.capture_post_entry.grid(row=3, column=3, padx=5, pady=5, sticky="ew")
+
         # Load saved values
         self.ip_entry.insert(0, controller.shared_data.get("ip", ""))
         interval = controller.shared_data.get("interval", "")
         self.interval_entry.insert(0, str(interval) if interval else "")
         self.excel_entry.insert(0, controller.shared_data.get("excel_file", "PLC_Log.xlsx"))
+        self.trigger_entry.insert(0, controller.shared_data.get("capture_condition", ""))
+        self.capture_rate_entry.insert(0, str(controller.shared_data.get("capture_interval", 0.05)))
+        self.capture_pre_entry.insert(0, str(controller.shared_data.get("capture_pre", 5.0)))
+        self.capture_post_entry.insert(0, str(controller.shared_data.get("capture_post", 5.0)))
 
         # Auto-save on typing
         self.ip_entry.bind("<KeyRelease>", self.update_shared_data)
         self.interval_entry.bind("<KeyRelease>", self.update_shared_data)
         self.excel_entry.bind("<KeyRelease>", self.update_shared_data)
+        for entry in (self.trigger_entry, self.capture_rate_entry, self.capture_pre_entry, self.capture_post_entry):
+            entry.bind("<KeyRelease>", self.update_shared_data)
 
         # Scrollable frame for tags
         self.scrollable_frame = ctk.CTkScrollableFrame(self)
@@ -68,23 +89,15 @@ class SetupPage(ctk.CTkFrame):
 
     # ---------------- Update Shared Data ----------------
     def update_shared_data(self, event=None):
+        # The settings store coerces/validates each value and debounces change
+        # events, so a keystroke here never restarts logging by itself.
         self.controller.shared_data["ip"] = self.ip_entry.get().strip()
-        interval_text = self.interval_entry.get().strip()
-        try:
-            interval = float(interval_text)
-            if interval <= 0:
-                raise ValueError
-            self.controller.shared_data["interval"] = interval
-        except ValueError:
-            self.controller.shared_data["interval"] = None
-            if interval_text:
-                messagebox.showwarning("Invalid Interval", "Please enter a positive number for the interval.")
-
-        excel_file = self.excel_entry.get().strip()
-        self.controller.shared_data["excel_file"] = excel_file if excel_file else "PLC_Log.xlsx"
-
-        if hasattr(self.controller, "notify_data_change"):
-            self.controller.notify_data_change()
+        self.controller.shared_data["interval"] = self.interval_entry.get().strip()
+        self.controller.shared_data["excel_file"] = self.excel_entry.get().strip()
+        self.controller.shared_data["capture_condition"] = self.trigger_entry.get().strip()
+        self.controller.shared_data["capture_interval"] = self.capture_rate_entry.get().strip()
+        self.controller.shared_data["capture_pre"] = self.capture_pre_entry.get().strip()
+        self.controller.shared_data["capture_post"] = self.capture_post_entry.get().strip()
 
     # ---------------- Test PLC Connection ----------------
     def test_connection(self):
@@ -180,6 +193,32 @@ class SetupPage(ctk.CTkFrame):
                 else:
                     selected.append(tag)
 
+        self.update_shared_data()
+        if not self.controller.shared_data.is_valid("ip"):
+            messagebox.showwarning("Invalid IP", "Please enter a full PLC IP address (e.g. 192.168.1.10) or hostname.")
+            return
+        if not self.controller.shared_data.is_valid("interval"):
+            messagebox.showwarning("Invalid Interval", "Please enter a positive number for the interval.")
+            return
+        if not self.controller.shared_data.is_valid("capture_condition"):
+            messagebox.showwarning(
+                "Invalid Capture Trigger", "Trigger must look like 'Fault_Bit == 1', or be blank to turn capture off."
+            )
+            return
+        # Capture rate and windows only matter when a trigger is set (blank = capture off)
+        if self.controller.shared_data["capture_condition"] and not self.controller.shared_data.is_valid(
+            "capture_interval", "capture_pre", "capture_post"
+        ):
+            messagebox.showwarning(
+                "Invalid Capture Settings",
+                "The capture rate must be positive and the pre/post windows must not be negative."
+            )
+            return
+
+        main_page = self.controller.frames.get("MainPage")
+        if main_page:
+            main_page.stop_refresh()  # stop any old refresh before settings are pushed
+
         self.controller.shared_data["tags_to_monitor"] = selected
         print(f"Selected tags: {selected}")
 
@@ -187,9 +226,7 @@ class SetupPage(ctk.CTkFrame):
             self.controller.notify_data_change()
 
         # ✅ Automatically start logging on MainPage
-        main_page = self.controller.frames.get("MainPage")
         if main_page:
-            main_page.stop_refresh()  # stop any old refresh
             main_page.start_refresh()  # start immediately
             self.controller.show_frame("MainPage")  # navigate back
             messagebox.showinfo("Logging Started", "Data collection has started automatically.")
@@ -0,0 +1,45 @@
+import operator
+import re
+
+
+# ---------------- Trigger Condition ----------------
+_CONDITION_RE = re.compile(r"^\s*([A-Za-z_][\w.:]*(?:\[\d+\])?)\s*(==|!=|>=|<=|>|<)\s*(\S+)\s*$")
+_OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">=": operator.ge,
+    "<=": operator.le,
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+
+class TriggerCondition:
+    """A single `Tag <op> value` comparison, e.g. "Fault_Bit == 1" or "Motor.Speed > 1500"."""
+
+    def __init__(self, tag, op, value):
+        self.tag = tag
+        self.op = op
+        self.value = value
+
+    @classmethod
+    def parse(cls, text):
+        match = _CONDITION_RE.match(text or "")
+        if not match:
+            raise ValueError(f"Invalid trigger condition: {text!r} (expected e.g. 'Fault_Bit == 1')")
+        tag, op, raw = match.groups()
+        if raw.lower() in ("true", "false"):
+            value = 1.0 if raw.lower() == "true" else 0.0
+        else:
+            value = float(raw)
+        return cls(tag, op, value)
+
+    def evaluate(self, row):
+        """Return True/False for a sample row, or None if the tag is missing or not numeric."""
+        try:
+            return _OPERATORS[self.op](float(row[self.tag]), self.value)
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def __str__(self):
+        return f"{self.tag} {self.op} {self.value:g}"